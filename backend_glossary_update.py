@@ -472,6 +472,9 @@ async def update_glossary():
     for term in glossary_terms:
         await db.glossary.insert_one(term.dict())
     
+    # Invalidate the API content cache
+    await db.content_meta.update_one({"_id": "content_version"}, {"$inc": {"version": 1}}, upsert=True)
+    
     print(f"Updated glossary with {len(glossary_terms)} terms")
 
 if __name__ == "__main__":
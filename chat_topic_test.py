@@ -0,0 +1,36 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+
+# The automaton is pure Python; the database client is created lazily so no server is needed
+sys.path.insert(0, str(Path(__file__).parent / 'backend'))
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'test_database')
+
+from server import KeywordAutomaton
+
+class TestKeywordAutomaton(unittest.TestCase):
+    """Word-boundary rules of the chat topic keyword matcher"""
+
+    def setUp(self):
+        self.automaton = KeywordAutomaton(["str", "short-term rental", "opportunity fund", "tax"])
+
+    def test_no_match_inside_words(self):
+        """Keywords are not found inside longer words"""
+        self.assertEqual(self.automaton.find("what is my best strategy?"), [])
+        self.assertEqual(self.automaton.find("less stress, lower taxis"), [])
+        self.assertEqual(self.automaton.find("a bestr deal"), [])
+
+    def test_plurals_match(self):
+        """An s/es plural still counts as the keyword"""
+        self.assertEqual(self.automaton.find("short-term rentals and opportunity funds"), ["short-term rental", "opportunity fund"])
+        self.assertEqual(self.automaton.find("lower taxes with strs"), ["tax", "str"])
+
+    def test_whole_words_match(self):
+        """Exact keywords match at text edges and next to punctuation"""
+        self.assertEqual(self.automaton.find("str."), ["str"])
+        self.assertEqual(self.automaton.find("(short-term rental)"), ["short-term rental"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,26 @@
+import asyncio
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent
+sys.path.insert(0, str(ROOT_DIR / 'backend'))
+
+from server import QUERY_PLAN_CHECKS, check_query_plans, client, ensure_indexes
+
+async def main():
+    # Create any missing indexes, then explain every endpoint query
+    await ensure_indexes()
+    failures = await check_query_plans()
+    client.close()
+
+    print(f"Checked {len(QUERY_PLAN_CHECKS)} endpoint queries")
+    if failures:
+        print("❌ Queries falling back to COLLSCAN:")
+        for failure in failures:
+            print(f"   - {failure}")
+        return 1
+    print("✅ Every endpoint query uses an index")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -2,7 +2,8 @@ import requests
 import json
 from pymongo import MongoClient
 import os
-import re
+
+from lesson_transforms import strip_redundant_intros as clean_module_content
 
 # Database connection
 MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
@@ -11,65 +12,6 @@ client = MongoClient(MONGO_URL)
 db = client[DB_NAME]
 courses_collection = db['courses']
 
-def clean_module_content(content):
-    """Remove redundant introductory paragraphs while preserving structured content"""
-    
-    # Patterns to identify redundant intro paragraphs that should be removed
-    redundant_patterns = [
-        # Remove blocks that start with module name/concept explanations
-        r'\*\*.*?Loop.*?\*\*.*?(?=##|\n\n[A-Z])',
-        r'\*\*.*?REPS.*?\*\*.*?(?=##|\n\n[A-Z])',
-        r'\*\*.*?Real Estate Professional Status.*?\*\*.*?(?=##|\n\n[A-Z])',
-        r'\*\*.*?Short-Term Rentals.*?\*\*.*?(?=##|\n\n[A-Z])',
-        r'\*\*.*?Oil & Gas.*?\*\*.*?(?=##|\n\n[A-Z])',
-        r'\*\*.*?MSO.*?\*\*.*?(?=##|\n\n[A-Z])',
-        r'\*\*.*?QSBS.*?\*\*.*?(?=##|\n\n[A-Z])',
-        r'\*\*.*?W-2 income.*?\*\*.*?(?=##|\n\n[A-Z])',
-        
-        # Remove explanatory paragraphs that start with common phrases
-        r'The U\.S\. tax code is not a punishment.*?(?=##|\n\n[A-Z])',
-        r'The \*\*Wealth Multiplier Loop\*\* represents.*?(?=##|\n\n[A-Z])',
-        r'\*\*Real Estate Professional Status \(REPS\)\*\* is.*?(?=##|\n\n[A-Z])',
-        r'\*\*Short-Term Rentals \(STRs\)\*\* represent.*?(?=##|\n\n[A-Z])',
-        r'\*\*Oil & Gas Deductions\*\* represent.*?(?=##|\n\n[A-Z])',
-        r'Most business owners are set up to fail.*?(?=##|\n\n[A-Z])',
-        r'Tax savings are only part of the game.*?(?=##|\n\n[A-Z])',
-        r'The highest-leverage move for business owners.*?(?=##|\n\n[A-Z])',
-        r'Most business owners see tax planning as a cost center.*?(?=##|\n\n[A-Z])',
-        r'As business owners build wealth.*?(?=##|\n\n[A-Z])',
-        r'The ultimate goal for business owners.*?(?=##|\n\n[A-Z])',
-        r'Every business owner\'s ultimate goal.*?(?=##|\n\n[A-Z])',
-        
-        # Remove duplicate What You'll Learn sections (keep only the first one)
-        r'## What You\'ll Learn\s*<ul>.*?</ul>\s*## What You\'ll Learn',
-        
-        # Remove introductory paragraphs between video and content sections
-        r'After understanding.*?(?=##|\n\n[A-Z])',
-        r'Now that you understand.*?(?=##|\n\n[A-Z])',
-        r'This module will.*?(?=##|\n\n[A-Z])',
-        r'In this module.*?(?=##|\n\n[A-Z])',
-        
-        # Remove generic concept explanations
-        r'Most.*?think.*?They\'re not.*?(?=##|\n\n[A-Z])',
-        r'You don\'t need.*?strategies.*?(?=##|\n\n[A-Z])',
-        r'There\'s one tax status.*?(?=##|\n\n[A-Z])',
-        r'Understanding.*?requires.*?(?=##|\n\n[A-Z])',
-    ]
-    
-    cleaned_content = content
-    
-    # Apply each pattern to remove redundant content
-    for pattern in redundant_patterns:
-        cleaned_content = re.sub(pattern, '', cleaned_content, flags=re.DOTALL | re.IGNORECASE)
-    
-    # Clean up multiple consecutive newlines
-    cleaned_content = re.sub(r'\n{3,}', '\n\n', cleaned_content)
-    
-    # Clean up leading/trailing whitespace
-    cleaned_content = cleaned_content.strip()
-    
-    return cleaned_content
-
 def update_module_content(module_id):
     """Update a module's content by removing redundant introductory paragraphs"""
     try:
@@ -152,6 +94,9 @@ def main():
     
     print(f"\n🎯 Cleanup complete: {updated_count}/{total_count} modules processed successfully")
     
+    # Invalidate the API content cache
+    db['content_meta'].update_one({"_id": "content_version"}, {"$inc": {"version": 1}}, upsert=True)
+    
     # Create summary report
     with open('module_cleanup_summary.md', 'w') as f:
         f.write("# Module Content Cleanup Summary\n\n")
@@ -13,6 +13,9 @@ async def clear_glossary_for_restructure():
     result = await db.glossary.delete_many({})
     print(f"✅ Cleared {result.deleted_count} glossary entries")
     
+    # Invalidate the API content cache
+    await db.content_meta.update_one({"_id": "content_version"}, {"$inc": {"version": 1}}, upsert=True)
+    
     # Verify empty
     remaining = await db.glossary.find({}).to_list(1000)
     print(f"Remaining entries: {len(remaining)}")
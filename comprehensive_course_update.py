@@ -528,6 +528,9 @@ Let's get started.""",
         await db.courses.insert_one(course.dict())
         print(f"Inserted {course.title} with {len(course.lessons)} lessons")
     
+    # Invalidate the API content cache
+    await db.content_meta.update_one({"_id": "content_version"}, {"$inc": {"version": 1}}, upsert=True)
+    
     print(f"Successfully updated all courses with enhanced learning outcomes")
 
 if __name__ == "__main__":
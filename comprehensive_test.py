@@ -27,7 +27,7 @@ def test_courses_endpoint():
     """Test the /api/courses endpoint to verify all 3 courses are returned"""
     print("\n=== Testing Core API Endpoint: /api/courses ===")
     
-    response = requests.get(f"{API_URL}/courses")
+    response = requests.get(f"{API_URL}/courses", params={"include_lessons": "true"})
     if response.status_code != 200:
         print(f"❌ Failed to get courses: {response.status_code}")
         return None
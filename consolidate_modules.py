@@ -177,6 +177,9 @@ def main():
     
     print(f"\n🎯 Module structure cleanup complete: {updated_count}/{total_count} modules updated successfully")
     
+    # Invalidate the API content cache
+    db['content_meta'].update_one({"_id": "content_version"}, {"$inc": {"version": 1}}, upsert=True)
+    
     # Create summary report
     with open('module_structure_cleanup_summary.md', 'w') as f:
         f.write("# Module Body Structure Cleanup Summary\n\n")
@@ -319,6 +319,9 @@ def main():
     
     print(f"\nUpdate complete: {updated_count}/{total_count} modules updated successfully")
     
+    # Invalidate the API content cache
+    db['content_meta'].update_one({"_id": "content_version"}, {"$inc": {"version": 1}}, upsert=True)
+    
     # Create summary report
     with open('module_update_summary.md', 'w') as f:
         f.write("# Module Content Update Summary\n\n")
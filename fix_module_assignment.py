@@ -66,6 +66,9 @@ def fix_module_assignment():
         {"$set": {"lessons": business_lessons, "total_lessons": len(business_lessons)}}
     )
     
+    # Invalidate the API content cache
+    db['content_meta'].update_one({"_id": "content_version"}, {"$inc": {"version": 1}}, upsert=True)
+    
     if result1.modified_count > 0 and result2.modified_count > 0:
         print(f"✅ Successfully moved 'The Exit Plan' module to Business Owner course")
         print(f"   W-2 Escape Plan now has {len(w2_lessons)} modules")
@@ -61,8 +61,20 @@ const CourseCard = ({ course, onCourseClick }) => {
 const CourseViewer = ({ course, onBack }) => {
   const [selectedModule, setSelectedModule] = useState(null);
 
-  const handleModuleClick = (lesson) => {
-    setSelectedModule(lesson);
+  const handleModuleClick = async (lesson) => {
+    if (lesson.content) {
+      setSelectedModule(lesson);
+      return;
+    }
+    // Catalog lessons are summaries; load the module body on demand
+    try {
+      const response = await fetch(`${API_BASE_URL}/api/courses/${course.id}/lessons/${lesson.id}`);
+      if (response.ok) {
+        setSelectedModule(await response.json());
+      }
+    } catch (error) {
+      console.error('Error fetching module:', error);
+    }
   };
 
   if (selectedModule) {
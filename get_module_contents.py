@@ -19,26 +19,16 @@ def get_module_content(module_id):
         print(f"Module ID {module_id} not found in all_modules.json")
         return None
     
-    # Get the course lessons
-    response = requests.get(f"http://localhost:8001/api/courses/{course_id}/lessons")
-    if response.status_code != 200:
-        print(f"Error fetching lessons for course {course_id}: {response.status_code}")
-        return None
-    
-    lessons = response.json()
-    
-    # Find the specific module
-    module_content = None
-    for lesson in lessons:
-        if lesson["id"] == module_id:
-            module_content = lesson
-            break
-    
-    if not module_content:
+    # Get the module directly from the per-lesson endpoint
+    response = requests.get(f"http://localhost:8001/api/courses/{course_id}/lessons/{module_id}")
+    if response.status_code == 404:
         print(f"Module ID {module_id} not found in course {course_id}")
         return None
+    if response.status_code != 200:
+        print(f"Error fetching module {module_id} for course {course_id}: {response.status_code}")
+        return None
     
-    return module_content
+    return response.json()
 
 def get_module_details(module_id):
     """Get module details including course information"""
@@ -0,0 +1,58 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+from dotenv import load_dotenv
+from pymongo import MongoClient
+
+ROOT_DIR = Path(__file__).parent
+sys.path.insert(0, str(ROOT_DIR / 'backend'))
+load_dotenv(ROOT_DIR / 'backend' / '.env')
+
+from server import GlossarySearchIndex
+
+# Database connection
+MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
+DB_NAME = os.environ.get('DB_NAME', 'test_database')
+client = MongoClient(MONGO_URL)
+db = client[DB_NAME]
+
+QUERIES = ["REPS", "cost", "W-2", "qualified opportunity", "depreciation offset", "str", "zzz", "(a+)+$"]
+ITERATIONS = 200
+
+def regex_search(q):
+    """The previous implementation: unanchored case-insensitive $regex on term and definition"""
+    return list(db.glossary.find({
+        "$or": [
+            {"term": {"$regex": q, "$options": "i"}},
+            {"definition": {"$regex": q, "$options": "i"}}
+        ]
+    }).limit(100))
+
+def time_per_call(fn, q):
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn(q)
+    return (time.perf_counter() - start) / ITERATIONS * 1000
+
+def main():
+    terms = list(db.glossary.find({}, {"_id": 0}))
+    print(f"Glossary terms: {len(terms)}")
+
+    start = time.perf_counter()
+    index = GlossarySearchIndex(terms)
+    print(f"Index build: {(time.perf_counter() - start) * 1000:.2f} ms ({len(index.vocabulary)} tokens)\n")
+
+    print(f"{'query':<24}{'$regex ms':>12}{'index ms':>12}{'regex hits':>12}{'index hits':>12}")
+    for q in QUERIES:
+        try:
+            regex_ms = f"{time_per_call(regex_search, q):.3f}"
+            regex_hits = str(len(regex_search(q)))
+        except Exception as e:
+            regex_ms, regex_hits = "error", type(e).__name__
+        index_ms = time_per_call(index.search, q)
+        print(f"{q:<24}{regex_ms:>12}{index_ms:>12.3f}{regex_hits:>12}{len(index.search(q)):>12}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent
+BACKEND_DIR = ROOT_DIR / 'backend'
+RUNS = 10
+
+# Imports server in a fresh interpreter, after its third-party dependencies so only
+# server.py itself is timed, and prints import ms, KB it keeps allocated and peak RSS in KB
+PROBE = """
+import resource, sys, time, tracemalloc
+sys.path.insert(0, sys.argv[1])
+import dotenv, fastapi, motor.motor_asyncio, pydantic, pymongo, starlette.middleware.cors
+tracemalloc.start()
+start = time.perf_counter()
+import server
+elapsed = (time.perf_counter() - start) * 1000
+print(elapsed, tracemalloc.get_traced_memory()[0] // 1024, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+def measure(backend_dir):
+    env = {**os.environ, "MONGO_URL": os.environ.get("MONGO_URL", "mongodb://localhost:27017"), "DB_NAME": os.environ.get("DB_NAME", "test_database")}
+    # Warm the bytecode cache so every run measures a normal worker start
+    subprocess.run([sys.executable, "-c", PROBE, str(backend_dir)], env=env, check=True, capture_output=True)
+    times, allocated, rss = [], [], []
+    for _ in range(RUNS):
+        out = subprocess.run([sys.executable, "-c", PROBE, str(backend_dir)], env=env, check=True, capture_output=True, text=True).stdout.split()
+        times.append(float(out[0]))
+        allocated.append(int(out[1]))
+        rss.append(int(out[2]))
+    return statistics.median(times), statistics.median(allocated), statistics.median(rss)
+
+def report(label, backend_dir):
+    source = backend_dir / 'server.py'
+    import_ms, allocated_kb, rss_kb = measure(backend_dir)
+    print(f"{label:<12}{source.stat().st_size / 1024:>12.0f}{import_ms:>12.1f}{allocated_kb:>14.0f}{rss_kb / 1024:>14.1f}")
+
+def main():
+    """Usage: python import_time_benchmark.py [git-rev-to-compare]"""
+    print(f"{'server.py':<12}{'source KB':>12}{'import ms':>12}{'retained KB':>14}{'peak RSS MB':>14}")
+    if len(sys.argv) > 1:
+        rev = sys.argv[1]
+        with tempfile.TemporaryDirectory() as tmp:
+            old_source = subprocess.run(["git", "show", f"{rev}:backend/server.py"], cwd=ROOT_DIR, check=True, capture_output=True).stdout
+            Path(tmp, 'server.py').write_bytes(old_source)
+            report(rev, Path(tmp))
+    report("working", BACKEND_DIR)
+
+if __name__ == "__main__":
+    main()
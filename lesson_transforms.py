@@ -0,0 +1,198 @@
+import argparse
+import difflib
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from pymongo import MongoClient, UpdateOne
+
+# Database connection
+MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
+DB_NAME = os.environ.get('DB_NAME', 'test_database')
+
+# Registered transforms: name -> function(content) -> content, applied in the order given
+TRANSFORMS = {}
+
+def transform(name):
+    def register(fn):
+        TRANSFORMS[name] = fn
+        return fn
+    return register
+
+# Redundant introductory paragraphs (from cleanup_modules.py)
+REDUNDANT_INTRO_RES = [re.compile(pattern, re.DOTALL | re.IGNORECASE) for pattern in [
+    # Remove blocks that start with module name/concept explanations
+    r'\*\*.*?Loop.*?\*\*.*?(?=##|\n\n[A-Z])',
+    r'\*\*.*?REPS.*?\*\*.*?(?=##|\n\n[A-Z])',
+    r'\*\*.*?Real Estate Professional Status.*?\*\*.*?(?=##|\n\n[A-Z])',
+    r'\*\*.*?Short-Term Rentals.*?\*\*.*?(?=##|\n\n[A-Z])',
+    r'\*\*.*?Oil & Gas.*?\*\*.*?(?=##|\n\n[A-Z])',
+    r'\*\*.*?MSO.*?\*\*.*?(?=##|\n\n[A-Z])',
+    r'\*\*.*?QSBS.*?\*\*.*?(?=##|\n\n[A-Z])',
+    r'\*\*.*?W-2 income.*?\*\*.*?(?=##|\n\n[A-Z])',
+
+    # Remove explanatory paragraphs that start with common phrases
+    r'The U\.S\. tax code is not a punishment.*?(?=##|\n\n[A-Z])',
+    r'The \*\*Wealth Multiplier Loop\*\* represents.*?(?=##|\n\n[A-Z])',
+    r'\*\*Real Estate Professional Status \(REPS\)\*\* is.*?(?=##|\n\n[A-Z])',
+    r'\*\*Short-Term Rentals \(STRs\)\*\* represent.*?(?=##|\n\n[A-Z])',
+    r'\*\*Oil & Gas Deductions\*\* represent.*?(?=##|\n\n[A-Z])',
+    r'Most business owners are set up to fail.*?(?=##|\n\n[A-Z])',
+    r'Tax savings are only part of the game.*?(?=##|\n\n[A-Z])',
+    r'The highest-leverage move for business owners.*?(?=##|\n\n[A-Z])',
+    r'Most business owners see tax planning as a cost center.*?(?=##|\n\n[A-Z])',
+    r'As business owners build wealth.*?(?=##|\n\n[A-Z])',
+    r'The ultimate goal for business owners.*?(?=##|\n\n[A-Z])',
+    r'Every business owner\'s ultimate goal.*?(?=##|\n\n[A-Z])',
+
+    # Remove duplicate What You'll Learn sections (keep only the first one)
+    r'## What You\'ll Learn\s*<ul>.*?</ul>\s*## What You\'ll Learn',
+
+    # Remove introductory paragraphs between video and content sections
+    r'After understanding.*?(?=##|\n\n[A-Z])',
+    r'Now that you understand.*?(?=##|\n\n[A-Z])',
+    r'This module will.*?(?=##|\n\n[A-Z])',
+    r'In this module.*?(?=##|\n\n[A-Z])',
+
+    # Remove generic concept explanations
+    r'Most.*?think.*?They\'re not.*?(?=##|\n\n[A-Z])',
+    r'You don\'t need.*?strategies.*?(?=##|\n\n[A-Z])',
+    r'There\'s one tax status.*?(?=##|\n\n[A-Z])',
+    r'Understanding.*?requires.*?(?=##|\n\n[A-Z])',
+]]
+BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+# "What You'll Learn" section and list formatting (from update_module_formatting.py)
+WYL_SECTION_RE = re.compile(r"## What You'll Learn\s*\n(.*?)(?=\n##|\Z)", re.DOTALL)
+WYL_BULLET_RES = [
+    re.compile(r"[-•*]\s*(.*?)(?=\n[-•*]|\Z)", re.DOTALL),  # Markdown style bullets
+    re.compile(r"\d+\.\s*(.*?)(?=\n\d+\.|\Z)", re.DOTALL),  # Numbered lists
+    re.compile(r"✅\s*(.*?)(?=\n✅|\Z)", re.DOTALL),         # Checkmark bullets
+]
+SECTION_SPACING_RE = re.compile(r'(##\s+[^\n]+)\n([^\n])')
+LIST_END_SPACING_RE = re.compile(r'(</ul>)\n([^\n])')
+LIST_START_SPACING_RE = re.compile(r'([^\n])\n(<ul>)')
+BULLET_RE = re.compile(r'\n\s*[-•*]\s+')
+BULLET_SPACING_RE = re.compile(r'(•\s+[^\n]+)\n([^\n•])')
+
+@transform("strip_intros")
+def strip_redundant_intros(content):
+    """Remove redundant introductory paragraphs while preserving structured content"""
+    for pattern in REDUNDANT_INTRO_RES:
+        content = pattern.sub('', content)
+    return BLANK_LINES_RE.sub('\n\n', content).strip()
+
+@transform("format_wyl")
+def format_what_youll_learn_section(content):
+    """Format the 'What You'll Learn' section with clean HTML"""
+    if "## What You'll Learn" not in content:
+        return content
+    match = WYL_SECTION_RE.search(content)
+    if not match:
+        return content
+
+    section_content = match.group(1).strip()
+    if "<ul>" in section_content and "</ul>" in section_content:
+        # It's already formatted, just ensure consistent styling
+        formatted_section = section_content
+    else:
+        items = []
+        for pattern in WYL_BULLET_RES:
+            matches = pattern.findall(section_content)
+            if matches:
+                items.extend(matches)
+                break
+        # If no bullet points found, split by newlines and filter empty lines
+        if not items:
+            items = [line.strip() for line in section_content.split('\n') if line.strip()]
+
+        formatted_items = []
+        for item in items:
+            # If the item already has <strong> tags, keep them
+            if "<strong>" in item and "</strong>" in item:
+                formatted_items.append(f"  <li>{item.strip()}</li>")
+            else:
+                formatted_items.append(f"  <li><strong>{item.strip()}</strong></li>")
+        formatted_section = "<ul>\n" + "\n".join(formatted_items) + "\n</ul>"
+
+    replacement = f"## What You'll Learn\n\n{formatted_section}\n\n"
+    return WYL_SECTION_RE.sub(lambda _: replacement, content)
+
+@transform("format_spacing")
+def format_spacing(content):
+    """Blank lines around headings and lists, and consistent bullet points"""
+    content = SECTION_SPACING_RE.sub(r'\1\n\n\2', content)
+    content = LIST_END_SPACING_RE.sub(r'\1\n\n\2', content)
+    content = LIST_START_SPACING_RE.sub(r'\1\n\n\2', content)
+    content = BULLET_RE.sub(r'\n• ', content)
+    return BULLET_SPACING_RE.sub(r'\1\n\n\2', content)
+
+def format_module_content(content):
+    """Format the entire module content with clean HTML"""
+    return format_spacing(format_what_youll_learn_section(content))
+
+def apply_transforms(job):
+    """Run one lesson through the chain; executed in the worker processes"""
+    names, lesson_id, content = job
+    for name in names:
+        content = TRANSFORMS[name](content)
+    return lesson_id, content
+
+def load_lessons(db):
+    """Every lesson once, streamed from a single query"""
+    for course in db.courses.find({}, {"_id": 0, "title": 1, "lessons.id": 1, "lessons.title": 1, "lessons.content": 1}):
+        for lesson in course.get("lessons", []):
+            yield course["title"], lesson
+
+def run(names, dry_run=False, workers=None):
+    db = MongoClient(MONGO_URL)[DB_NAME]
+    start = time.perf_counter()
+    lessons = {lesson["id"]: (course_title, lesson) for course_title, lesson in load_lessons(db)}
+    loaded = time.perf_counter()
+
+    jobs = [(names, lesson_id, lesson.get("content", "")) for lesson_id, (_, lesson) in lessons.items()]
+    executor = None if workers == 0 else ProcessPoolExecutor(max_workers=workers)
+    updates = []
+    try:
+        if executor:
+            results = executor.map(apply_transforms, jobs, chunksize=max(1, len(jobs) // (4 * (workers or os.cpu_count() or 1))))
+        else:
+            results = map(apply_transforms, jobs)
+        # Results stream back in submission order as the workers finish them
+        for lesson_id, new_content in results:
+            course_title, lesson = lessons[lesson_id]
+            old_content = lesson.get("content", "")
+            if new_content == old_content:
+                continue
+            # Clearing the hash makes the next sync_module_contents run rehash the lesson
+            updates.append(UpdateOne({"lessons.id": lesson_id}, {"$set": {"lessons.$.content": new_content}, "$unset": {"lessons.$.content_hash": ""}}))
+            print(f"~ {course_title} / {lesson.get('title', lesson_id)} ({len(new_content) - len(old_content):+d} chars)")
+            if dry_run:
+                diff = difflib.unified_diff(old_content.splitlines(), new_content.splitlines(), f"{lesson_id} (stored)", f"{lesson_id} ({' > '.join(names)})", n=1, lineterm="")
+                print("\n".join(diff) + "\n")
+    finally:
+        if executor:
+            executor.shutdown()
+    transformed = time.perf_counter()
+
+    if updates and not dry_run:
+        db.courses.bulk_write(updates, ordered=False)
+        # Invalidate the API content cache
+        db.content_meta.update_one({"_id": "content_version"}, {"$inc": {"version": 1}}, upsert=True)
+    written = time.perf_counter()
+
+    print(f"{'Would change' if dry_run else 'Changed'} {len(updates)} of {len(lessons)} lessons with {' > '.join(names)}")
+    print(f"Timings: load {(loaded - start) * 1000:.1f} ms, transform {(transformed - loaded) * 1000:.1f} ms, write {(written - transformed) * 1000:.1f} ms")
+    return updates
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply registered content transforms to every lesson and save the results in one bulk write")
+    parser.add_argument("transforms", nargs="+", choices=sorted(TRANSFORMS), help="transforms to apply, in order")
+    parser.add_argument("--dry-run", action="store_true", help="print a diff of each changed lesson without writing")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU, 0 runs in this process)")
+    args = parser.parse_args()
+    run(args.transforms, args.dry_run, args.workers)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import base64
+import json
+import os
+import sys
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+# Cursor encoding is pure Python; the database client is created lazily so no server is needed
+sys.path.insert(0, str(Path(__file__).parent / 'backend'))
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'test_database')
+
+from fastapi import HTTPException
+from pymongo import ASCENDING, DESCENDING
+from server import decode_cursor, encode_cursor, keyset_after
+
+def raw_cursor(text):
+    return base64.urlsafe_b64encode(text.encode()).decode().rstrip("=")
+
+class TestPaginationCursor(unittest.TestCase):
+    """Opaque keyset cursors: round trip, tampering and value types"""
+
+    def assertInvalid(self, cursor, size=2):
+        with self.assertRaises(HTTPException) as ctx:
+            decode_cursor(cursor, size)
+        self.assertEqual(ctx.exception.status_code, 400)
+        self.assertEqual(ctx.exception.detail, "Invalid cursor")
+
+    def test_round_trip(self):
+        """Encoded sort key values decode unchanged, datetimes included"""
+        values = [datetime(2026, 1, 2, 3, 4, 5, 678000), "msg-1"]
+        self.assertEqual(decode_cursor(encode_cursor(values), 2), values)
+        self.assertEqual(decode_cursor(encode_cursor(["Depreciation", 7]), 2), ["Depreciation", 7])
+
+    def test_tampered_cursors(self):
+        """Garbage, wrong shapes and malformed extended JSON are a 400, not a 500"""
+        for cursor in [
+            "not base64!!",
+            raw_cursor("not json"),
+            raw_cursor('{"a": 1}'),
+            raw_cursor('["only one"]'),
+            raw_cursor('[{"$oid": "zz"}, 1]'),
+            raw_cursor('[{"$date": "bad"}, 1]'),
+            raw_cursor('[{"$binary": 1}, 1]'),
+            raw_cursor('[{"$numberDecimal": "x"}, 1]'),
+        ]:
+            with self.subTest(cursor=cursor):
+                self.assertInvalid(cursor)
+
+    def test_rejects_non_sort_key_values(self):
+        """Operator documents and other non-scalar values cannot reach the query"""
+        for values in [[{"$ne": None}, "x"], [{"$regex": "."}, "x"], ["a", None], [True, "x"], [["a"], "x"]]:
+            with self.subTest(values=values):
+                self.assertInvalid(raw_cursor(json.dumps(values)))
+
+    def test_keyset_after(self):
+        """Strictly after the last key, tie-broken by the later sort fields"""
+        query = keyset_after([("timestamp", DESCENDING), ("id", DESCENDING)], ["t1", "m1"])
+        self.assertEqual(query, {"$or": [{"timestamp": {"$lt": "t1"}}, {"timestamp": "t1", "id": {"$lt": "m1"}}]})
+        query = keyset_after([("term", ASCENDING), ("id", ASCENDING)], ["REPS", "g1"])
+        self.assertEqual(query, {"$or": [{"term": {"$gt": "REPS"}}, {"term": "REPS", "id": {"$gt": "g1"}}]})
+
+if __name__ == "__main__":
+    unittest.main()
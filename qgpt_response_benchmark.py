@@ -0,0 +1,39 @@
+import sys
+import time
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+ROOT_DIR = Path(__file__).parent
+sys.path.insert(0, str(ROOT_DIR / 'backend'))
+load_dotenv(ROOT_DIR / 'backend' / '.env')
+
+from server import generate_qgpt_response
+
+MESSAGES = [
+    "How do I qualify for REPS?",
+    "What's the best W-2 offset strategy for a $300K salary?",
+    "How does cost segregation work on a $2M rental?",
+    "Should I put my RSU gains into a QOF?",
+    "Help me get started",
+    "Can you explain split-dollar life insurance?",
+    "What about my 401k contributions this year and next year, given my bonus?",
+]
+ITERATIONS = 20000
+
+def main():
+    cases = [
+        (message, has_full_access, True)
+        for message in MESSAGES
+        for has_full_access in (True, False)
+    ]
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        for message, has_full_access, has_subscription in cases:
+            generate_qgpt_response(message, has_full_access, has_subscription, ["REPS"], [])
+    elapsed = time.perf_counter() - start
+    calls = ITERATIONS * len(cases)
+    print(f"{calls} calls in {elapsed:.2f}s: {elapsed / calls * 1e6:.2f} us per message")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+
+# QGPT intent dispatch is pure Python; the database client is created lazily so no server is needed
+sys.path.insert(0, str(Path(__file__).parent / 'backend'))
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'test_database')
+
+from server import QGPT_RESPONSES, generate_qgpt_response
+
+class TestQGPTIntents(unittest.TestCase):
+    """Which canned QGPT answer a question gets"""
+
+    def respond(self, message, has_full_access=True):
+        return generate_qgpt_response(message, has_full_access, True, [], [])
+
+    def test_plural_and_inflected_keywords(self):
+        """Plural and inflected forms still reach their strategy answer"""
+        cases = {
+            "Should I invest in opportunity funds?": "qof",
+            "Tell me about opportunity zones": "qof",
+            "Are QOFs worth it?": "qof",
+            "w-2 offsets for my salary": "w2_offset",
+            "Explain salary offsets": "w2_offset",
+            "Real estate professionals rules?": "reps",
+            "How to get started": "help",
+            "I'm a beginner": "help",
+        }
+        for message, intent in cases.items():
+            with self.subTest(message=message):
+                self.assertEqual(self.respond(message), QGPT_RESPONSES[intent])
+
+    def test_priority(self):
+        """The earliest intent in QGPT_INTENTS wins when several match"""
+        self.assertEqual(self.respond("Help with REPS and cost segregation"), QGPT_RESPONSES["reps"])
+        self.assertEqual(self.respond("Is QSBS better than REPS?", has_full_access=False), QGPT_RESPONSES["premium"])
+        self.assertEqual(self.respond("Is QSBS better than REPS?"), QGPT_RESPONSES["reps"])
+
+    def test_no_match_inside_words(self):
+        """Keywords inside longer words fall through to the generic answer"""
+        for message in ["This was helpful", "Can I renew my plan?", "What about my 401k contributions?"]:
+            with self.subTest(message=message):
+                self.assertNotIn(self.respond(message), QGPT_RESPONSES.values())
+
+if __name__ == "__main__":
+    unittest.main()
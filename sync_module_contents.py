@@ -0,0 +1,115 @@
+import argparse
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from pymongo import MongoClient, UpdateOne
+
+# Database connection
+MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
+DB_NAME = os.environ.get('DB_NAME', 'test_database')
+
+ROOT_DIR = Path(__file__).parent
+# The lesson files /api/initialize-data seeds from; module_contents/ is an older export
+DEFAULT_LESSON_DIR = ROOT_DIR / "backend" / "seed_data" / "lessons"
+
+def lesson_hash(fields):
+    """Stable hash of the lesson fields a file sets"""
+    return hashlib.sha256(json.dumps(fields, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+
+def read_lesson_files(module_dir):
+    """Lesson id -> (file name, fields to set); formatted_* review copies are skipped"""
+    lessons = {}
+    for path in sorted(Path(module_dir).glob("*.json")):
+        if path.name.startswith("formatted_"):
+            continue
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        lessons[data["id"]] = (path.name, {key: value for key, value in data.items() if key != "id"})
+    return lessons
+
+def stored_hashes(db, lesson_ids):
+    """Lesson id -> (course title, stored content hash or None) for the lessons in the database"""
+    stored = {}
+    for course in db.courses.find({"lessons.id": {"$in": lesson_ids}}, {"_id": 0, "title": 1, "lessons.id": 1, "lessons.content_hash": 1}):
+        for lesson in course["lessons"]:
+            stored[lesson["id"]] = (course["title"], lesson.get("content_hash"))
+    return stored
+
+def current_hashes(db, lesson_ids, files):
+    """Hash lessons that predate content_hash from what is in the database now"""
+    hashes = {}
+    for course in db.courses.find({"lessons.id": {"$in": lesson_ids}}, {"_id": 0, "lessons": 1}):
+        for lesson in course["lessons"]:
+            if lesson["id"] in lesson_ids:
+                _, fields = files[lesson["id"]]
+                hashes[lesson["id"]] = lesson_hash({key: lesson.get(key) for key in fields})
+    return hashes
+
+def sync(module_dir, dry_run=False):
+    db = MongoClient(MONGO_URL)[DB_NAME]
+    timings = {}
+    start = time.perf_counter()
+
+    files = read_lesson_files(module_dir)
+    file_hashes = {lesson_id: lesson_hash(fields) for lesson_id, (_, fields) in files.items()}
+    timings["read+hash"] = time.perf_counter() - start
+
+    mark = time.perf_counter()
+    stored = stored_hashes(db, list(files))
+    # Only lessons with a file here; the matched courses may hold others
+    unhashed = [lesson_id for lesson_id, (_, content_hash) in stored.items() if content_hash is None and lesson_id in files]
+    existing = current_hashes(db, unhashed, files) if unhashed else {}
+
+    updates, changed, backfilled, unchanged = [], [], [], 0
+    for lesson_id, (filename, fields) in files.items():
+        if lesson_id not in stored:
+            continue
+        new_hash = file_hashes[lesson_id]
+        old_hash = stored[lesson_id][1]
+        if old_hash == new_hash:
+            unchanged += 1
+            continue
+        update = {"lessons.$.content_hash": new_hash}
+        if old_hash is None and existing.get(lesson_id) == new_hash:
+            # Same content, it just has no hash yet
+            backfilled.append(lesson_id)
+        else:
+            update.update({f"lessons.$.{key}": value for key, value in fields.items()})
+            changed.append((filename, stored[lesson_id][0]))
+        updates.append(UpdateOne({"lessons.id": lesson_id}, {"$set": update}))
+    missing = sorted(filename for lesson_id, (filename, _) in files.items() if lesson_id not in stored)
+    timings["diff"] = time.perf_counter() - mark
+
+    mark = time.perf_counter()
+    modified = 0
+    if updates and not dry_run:
+        modified = db.courses.bulk_write(updates, ordered=False).modified_count
+        if changed:
+            # Invalidate the API content cache
+            db.content_meta.update_one({"_id": "content_version"}, {"$inc": {"version": 1}}, upsert=True)
+    timings["write"] = time.perf_counter() - mark
+    timings["total"] = time.perf_counter() - start
+
+    print(f"{'Would update' if dry_run else 'Updated'} {len(changed)} lessons from {module_dir}:")
+    for filename, course_title in changed:
+        print(f"  ~ {filename} ({course_title})")
+    print(f"Unchanged: {unchanged}, hash recorded only: {len(backfilled)}, documents modified: {modified}")
+    if missing:
+        print(f"Not in the database ({len(missing)}):")
+        for filename in missing:
+            print(f"  ? {filename}")
+    print("Timings: " + ", ".join(f"{stage} {seconds * 1000:.1f} ms" for stage, seconds in timings.items()))
+    return changed
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply changed lesson files to the courses collection in one bulk write")
+    parser.add_argument("module_dir", nargs="?", default=str(DEFAULT_LESSON_DIR), help="directory of <course>_<nn>_<lesson id>.json files (default: the seed lessons)")
+    parser.add_argument("--dry-run", action="store_true", help="report what would change without writing")
+    args = parser.parse_args()
+    sync(args.module_dir, args.dry_run)
+
+if __name__ == "__main__":
+    main()
@@ -228,6 +228,9 @@ async def update_course_learning_outcomes():
             {'$set': {'lessons': course['lessons']}}
         )
     
+    # Invalidate the API content cache
+    await db.content_meta.update_one({"_id": "content_version"}, {"$inc": {"version": 1}}, upsert=True)
+    
     print("\n✅ All learning outcomes updated successfully!")
 
 if __name__ == "__main__":
@@ -19,6 +19,9 @@ async def update_learning_outcomes():
     # Clear existing courses to replace with updated versions
     await db.courses.delete_many({})
     
+    # Invalidate the API content cache
+    await db.content_meta.update_one({"_id": "content_version"}, {"$inc": {"version": 1}}, upsert=True)
+    
     # PRIMER COURSE - The Escape Blueprint (5 modules)
     primer_learning_outcomes = {
         1: """## What You'll Learn
@@ -1,7 +1,8 @@
 import json
 import os
 import requests
-import re
+
+from lesson_transforms import format_module_content
 
 def update_module_content(module_id, new_content):
     """Update the content of a specific module"""
@@ -39,89 +40,6 @@ def update_module_content(module_id, new_content):
         print(response.text)
         return False
 
-def format_what_youll_learn_section(content):
-    """Format the 'What You'll Learn' section with clean HTML"""
-    # Check if the section exists
-    if "## What You'll Learn" not in content:
-        return content
-    
-    # Extract the section
-    pattern = r"## What You'll Learn\s*\n(.*?)(?=\n##|\Z)"
-    match = re.search(pattern, content, re.DOTALL)
-    
-    if not match:
-        return content
-    
-    section_content = match.group(1).strip()
-    
-    # Check if it's already in <ul> format
-    if "<ul>" in section_content and "</ul>" in section_content:
-        # It's already formatted, just ensure consistent styling
-        formatted_section = section_content
-    else:
-        # Convert bullet points or other formats to <ul> format
-        items = []
-        
-        # Try to match different bullet point styles
-        bullet_patterns = [
-            r"[-•*]\s*(.*?)(?=\n[-•*]|\Z)",  # Markdown style bullets
-            r"\d+\.\s*(.*?)(?=\n\d+\.|\Z)",  # Numbered lists
-            r"✅\s*(.*?)(?=\n✅|\Z)",         # Checkmark bullets
-        ]
-        
-        for pattern in bullet_patterns:
-            matches = re.findall(pattern, section_content, re.DOTALL)
-            if matches:
-                items.extend(matches)
-                break
-        
-        # If no bullet points found, split by newlines and filter empty lines
-        if not items:
-            items = [line.strip() for line in section_content.split('\n') if line.strip()]
-        
-        # Format as HTML list
-        formatted_items = []
-        for item in items:
-            # If the item already has <strong> tags, keep them
-            if "<strong>" in item and "</strong>" in item:
-                formatted_items.append(f"  <li>{item.strip()}</li>")
-            else:
-                formatted_items.append(f"  <li><strong>{item.strip()}</strong></li>")
-        
-        formatted_section = "<ul>\n" + "\n".join(formatted_items) + "\n</ul>"
-    
-    # Replace the original section with the formatted one
-    new_content = re.sub(
-        r"## What You'll Learn\s*\n(.*?)(?=\n##|\Z)",
-        f"## What You'll Learn\n\n{formatted_section}\n\n",
-        content,
-        flags=re.DOTALL
-    )
-    
-    return new_content
-
-def format_module_content(content):
-    """Format the entire module content with clean HTML"""
-    # Format the "What You'll Learn" section
-    content = format_what_youll_learn_section(content)
-    
-    # Ensure proper spacing between sections
-    content = re.sub(r'(##\s+[^\n]+)\n([^\n])', r'\1\n\n\2', content)
-    
-    # Ensure proper spacing after lists
-    content = re.sub(r'(</ul>)\n([^\n])', r'\1\n\n\2', content)
-    
-    # Ensure proper spacing before lists
-    content = re.sub(r'([^\n])\n(<ul>)', r'\1\n\n\2', content)
-    
-    # Format bullet points consistently
-    content = re.sub(r'\n\s*[-•*]\s+', r'\n• ', content)
-    
-    # Ensure proper spacing for bullet points
-    content = re.sub(r'(•\s+[^\n]+)\n([^\n•])', r'\1\n\n\2', content)
-    
-    return content
-
 def process_all_modules():
     """Process and update all modules with improved formatting"""
     # Get all module files
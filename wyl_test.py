@@ -17,7 +17,7 @@ def test_what_youll_learn_sections():
     print("\n=== Testing 'What You'll Learn' Sections ===\n")
     
     # Get all courses
-    response = requests.get(f"{BASE_URL}/courses")
+    response = requests.get(f"{BASE_URL}/courses", params={"include_lessons": "true"})
     courses = response.json()
     
     # Track statistics
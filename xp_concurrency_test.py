@@ -0,0 +1,59 @@
+import unittest
+import requests
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+
+class TestXPConcurrency(unittest.TestCase):
+    """Hammer the XP award endpoints for a single user and check no award is lost or doubled"""
+
+    def setUp(self):
+        """Set up the test environment"""
+        self.base_url = os.environ.get('REACT_APP_BACKEND_URL', 'http://localhost:8001')
+        if not self.base_url.endswith('/api'):
+            self.base_url = urljoin(self.base_url, '/api/')
+        else:
+            self.base_url = self.base_url + '/'
+
+        # Fresh user so the first requests race to create the XP record
+        self.test_user_id = f"xp_concurrency_{uuid.uuid4()}"
+        print(f"Using test user ID: {self.test_user_id}")
+
+    def post_all(self, path, payloads, workers=32):
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            responses = list(pool.map(lambda payload: requests.post(urljoin(self.base_url, path), json=payload), payloads))
+        for response in responses:
+            self.assertEqual(response.status_code, 200, f"{path} failed: {response.text}")
+        return [response.json() for response in responses]
+
+    def test_concurrent_glossary_views(self):
+        """Each term awards XP exactly once no matter how many concurrent views"""
+        term_ids = [f"term_{i}" for i in range(20)]
+        payloads = [{"user_id": self.test_user_id, "term_id": term_id} for term_id in term_ids * 10]
+
+        results = self.post_all('users/xp/glossary', payloads)
+        awarded = [result for result in results if result["status"] == "success"]
+        print(f"{len(awarded)} of {len(results)} views awarded XP")
+        self.assertEqual(len(awarded), len(term_ids), "Each term should award XP exactly once")
+
+        xp = requests.get(urljoin(self.base_url, f'users/xp/{self.test_user_id}')).json()
+        self.assertEqual(xp["glossary_xp"], 10 * len(term_ids))
+        self.assertEqual(xp["total_xp"], 10 * len(term_ids))
+        viewed = requests.get(urljoin(self.base_url, f'users/xp/{self.test_user_id}/viewed-terms')).json()
+        self.assertEqual(sorted(viewed), sorted(term_ids))
+        print(f"✅ Glossary XP is {xp['glossary_xp']} after {len(payloads)} concurrent views")
+
+    def test_concurrent_quiz_awards(self):
+        """No quiz award is lost to a read-modify-write race"""
+        payloads = [{"user_id": self.test_user_id, "points": 5} for _ in range(200)]
+
+        self.post_all('users/xp/quiz', payloads)
+
+        xp = requests.get(urljoin(self.base_url, f'users/xp/{self.test_user_id}')).json()
+        self.assertEqual(xp["quiz_xp"], 5 * len(payloads))
+        self.assertEqual(xp["total_xp"], 5 * len(payloads))
+        print(f"✅ Quiz XP is {xp['quiz_xp']} after {len(payloads)} concurrent awards")
+
+if __name__ == "__main__":
+    unittest.main()